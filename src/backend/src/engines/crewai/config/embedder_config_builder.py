@@ -15,8 +15,57 @@ import logging
 from src.core.logger import LoggerManager
 from src.utils.databricks_url_utils import DatabricksURLUtils
 
+# orjson ships with chromadb; fall back to the stdlib encoder if it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = LoggerManager.get_instance().crew
 
+# Shared HTTP session for Databricks embedding calls, created on first use
+_embedding_session = None
+
+# (connect, read) timeouts: fail fast on unreachable hosts, allow slow inference
+_EMBEDDING_TIMEOUT = (5.0, 30.0)
+
+
+def _get_embedding_session():
+    """
+    Get the shared requests session used for Databricks embedding calls.
+
+    Reusing one pooled session across embedding calls amortizes TCP/TLS
+    handshakes and DNS lookups instead of paying them on every request.
+
+    Returns:
+        requests.Session with a pooled, retrying HTTPS adapter mounted
+    """
+    global _embedding_session
+    if _embedding_session is None:
+        import socket
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.connection import HTTPConnection
+        from urllib3.util.retry import Retry
+
+        class _KeepAliveAdapter(HTTPAdapter):
+            """HTTPAdapter that enables TCP keepalive so dead pooled connections are detected."""
+
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                ]
+                super().init_poolmanager(*args, **kwargs)
+
+        session = requests.Session()
+        # Only retry failed connections: a POST may already have reached the
+        # server, and error statuses are handled by the embedding function
+        retry_strategy = Retry(total=3, connect=3, read=False, status=False, backoff_factor=0.2)
+        adapter = _KeepAliveAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry_strategy)
+        session.mount("https://", adapter)
+        _embedding_session = session
+    return _embedding_session
+
 
 class EmbedderConfigBuilder:
     """Handles embedder configuration for different providers"""
@@ -116,7 +165,7 @@ class EmbedderConfigBuilder:
             auth_headers = None
 
             logger.info("Using unified Databricks auth for embeddings")
-            logger.info(f"User token available: {bool(self.user_token)}, token length: {len(self.user_token) if self.user_token else 0}")
+            logger.debug("User token available: %s", bool(self.user_token))
 
             # Get headers using unified auth
             auth_headers, error = await get_databricks_auth_headers(user_token=self.user_token)
@@ -149,15 +198,13 @@ class EmbedderConfigBuilder:
 
                 def __call__(self, input: Documents) -> Embeddings:
                     try:
-                        import requests
-
                         workspace_url = DatabricksURLUtils.extract_workspace_from_endpoint(self.api_base)
                         endpoint_url = DatabricksURLUtils.construct_model_invocation_url(workspace_url, self.model)
 
                         if not endpoint_url:
                             raise Exception("Failed to construct valid endpoint URL")
 
-                        logger.debug(f"Databricks embedding endpoint URL: {endpoint_url}")
+                        logger.debug("Databricks embedding endpoint URL: %s", endpoint_url)
                         payload = {"input": input if isinstance(input, list) else [input]}
 
                         # Prepare headers - prioritize user token for OBO auth
@@ -178,9 +225,13 @@ class EmbedderConfigBuilder:
                             logger.error("No authentication method available for Databricks embeddings")
                             raise Exception("No authentication method available")
 
-                        response = requests.post(endpoint_url, headers=headers, json=payload, timeout=30)
+                        session = _get_embedding_session()
+                        if orjson is not None:
+                            response = session.post(endpoint_url, headers=headers, data=orjson.dumps(payload), timeout=_EMBEDDING_TIMEOUT)
+                        else:
+                            response = session.post(endpoint_url, headers=headers, json=payload, timeout=_EMBEDDING_TIMEOUT)
                         if response.status_code == 200:
-                            result = response.json()
+                            result = orjson.loads(response.content) if orjson is not None else response.json()
                             if 'data' in result and len(result['data']) > 0:
                                 embeddings = [item.get('embedding', item) for item in result['data']]
                                 return cast(Embeddings, embeddings)
@@ -68,12 +68,14 @@ class DatabricksConfigRepository(BaseRepository[DatabricksConfig]):
         
         return query.first()
     
-    async def deactivate_all(self, group_id: Optional[str] = None) -> None:
+    async def deactivate_all(self, group_id: Optional[str] = None, commit: bool = True) -> None:
         """
         Deactivate all existing Databricks configurations for the specified group.
         
         Args:
             group_id: Optional group ID to filter by
+            commit: Whether to commit immediately. Pass False to keep the
+                update inside the caller's transaction.
             
         Returns:
             None
@@ -86,7 +88,27 @@ class DatabricksConfigRepository(BaseRepository[DatabricksConfig]):
         if group_id is not None:
             query = query.where(self.model.group_id == group_id)
         await self.session.execute(query)
-        await self.session.commit()  # Make sure the changes are committed
+        if commit:
+            await self.session.commit()  # Make sure the changes are committed
+
+    async def lock_active_configs(self, group_id: Optional[str] = None) -> None:
+        """
+        Lock the active configuration rows for the specified group (SELECT ... FOR UPDATE).
+        
+        Concurrent writers for the same group are serialized on the small active
+        set only; readers are not blocked. Dialects without row locking (SQLite)
+        simply ignore the FOR UPDATE clause.
+        
+        Args:
+            group_id: Optional group ID to filter by
+            
+        Returns:
+            None
+        """
+        query = select(self.model.id).where(self.model.is_active == True)
+        if group_id is not None:
+            query = query.where(self.model.group_id == group_id)
+        await self.session.execute(query.with_for_update())
     
     async def create_config(self, config_data: dict) -> DatabricksConfig:
         """
@@ -101,9 +123,11 @@ class DatabricksConfigRepository(BaseRepository[DatabricksConfig]):
         if config_data is None:
             raise TypeError("config_data cannot be None")
             
-        # First deactivate any existing active configurations for this group
+        # Lock the current active rows, then deactivate them and insert the new
+        # configuration within a single transaction
         group_id = config_data.get('group_id')
-        await self.deactivate_all(group_id=group_id)
+        await self.lock_active_configs(group_id=group_id)
+        await self.deactivate_all(group_id=group_id, commit=False)
         
         # Create the new configuration
         db_config = DatabricksConfig(**config_data)
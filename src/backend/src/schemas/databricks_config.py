@@ -3,6 +3,10 @@ from typing import List, Optional
 from pydantic import BaseModel, Field, model_validator
 
 
+# Fields that must be non-empty when Databricks is enabled, in error-message order
+_REQUIRED_WHEN_ENABLED = ("warehouse_id", "catalog", "db_schema")
+
+
 class DatabricksConfigBase(BaseModel):
     """Base schema for Databricks configuration."""
     workspace_url: str = ""
@@ -38,7 +42,7 @@ class DatabricksConfigCreate(DatabricksConfigBase):
     def required_fields(self) -> List[str]:
         """Get list of required fields based on configuration"""
         if self.enabled:
-            return ["warehouse_id", "catalog", "db_schema"]
+            return list(_REQUIRED_WHEN_ENABLED)
         return []
 
     @model_validator(mode='after')
@@ -48,19 +52,8 @@ class DatabricksConfigCreate(DatabricksConfigBase):
         if not self.enabled:
             return self
 
-        # Check required fields
-        required_fields = ["warehouse_id", "catalog", "db_schema"]
-        empty_fields = []
-
-        for field in required_fields:
-            # Handle the schema field
-            if field == "db_schema":
-                value = self.db_schema
-            else:
-                value = getattr(self, field, "")
-
-            if not value:
-                empty_fields.append(field)
+        # Field values live in __dict__ under their field names (db_schema, not the alias)
+        empty_fields = [field for field in _REQUIRED_WHEN_ENABLED if not self.__dict__.get(field)]
 
         if empty_fields:
             raise ValueError(f"Invalid configuration: {', '.join(empty_fields)} must be non-empty when Databricks is enabled")
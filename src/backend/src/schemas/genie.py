@@ -130,6 +130,8 @@ class GenieStartConversationResponse(BaseModel):
     created_at: Optional[datetime] = Field(None, description="Creation timestamp")
     
     class Config:
+        frozen = True  # Output only; never mutated after construction
+        extra = "forbid"
         json_encoders = {
             datetime: lambda v: v.isoformat() if v else None
         }
@@ -152,6 +154,8 @@ class GenieSendMessageResponse(BaseModel):
     
     class Config:
         use_enum_values = True
+        frozen = True  # Output only; never mutated after construction
+        extra = "forbid"
 
 
 class GenieGetMessageStatusRequest(BaseModel):
@@ -198,4 +202,6 @@ class GenieExecutionResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     
     class Config:
-        use_enum_values = True
\ No newline at end of file
+        use_enum_values = True
+        frozen = True  # Output only; never mutated after construction
+        extra = "forbid"
\ No newline at end of file
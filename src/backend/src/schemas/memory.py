@@ -6,7 +6,7 @@ such as listing, searching, resetting, and retrieving information about
 CrewAI agent memories.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Literal
 from pydantic import BaseModel, Field
 
 
@@ -24,7 +24,7 @@ class MemoryListResponse(BaseModel):
 class MemoryActionResponse(BaseModel):
     """Response model for memory actions like reset or delete."""
     
-    status: str = Field(
+    status: Literal["success", "failure"] = Field(
         description="Status of the action (success/failure)"
     )
     message: str = Field(
@@ -188,7 +188,7 @@ class MemoryStatsResponse(BaseModel):
 class MemoryCleanupResponse(BaseModel):
     """Response model for memory cleanup operations."""
     
-    status: str = Field(
+    status: Literal["success", "failure"] = Field(
         description="Status of the cleanup (success/failure)"
     )
     message: str = Field(
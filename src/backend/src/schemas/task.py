@@ -38,10 +38,10 @@ class TaskBase(BaseModel):
     description: str
     agent_id: Optional[str] = None
     expected_output: str
-    tools: List[str] = Field(default_factory=list)
+    tools: tuple[str, ...] = ()  # Immutable, so the empty default can be shared
     tool_configs: Optional[Dict[str, Dict[str, Any]]] = Field(default_factory=dict)  # Tool-specific config overrides
     async_execution: bool = False
-    context: List[Union[str, str]] = Field(default_factory=list)
+    context: tuple[str, ...] = ()
     config: TaskConfig = Field(default_factory=TaskConfig)
     output_json: Optional[str] = None
     output_pydantic: Optional[str] = None
@@ -2,6 +2,7 @@ import os
 import logging
 import requests
 import base64
+import time
 from typing import Dict, Tuple, Optional, Any
 
 from fastapi import HTTPException
@@ -11,6 +12,26 @@ from src.schemas.databricks_config import DatabricksConfigCreate, DatabricksConf
 
 logger = logging.getLogger(__name__)
 
+# Active configuration per group_id as (response, cached_at). The configuration is
+# read on most Databricks operations but changes rarely, so short-lived reads skip the DB.
+_CONFIG_CACHE_TTL_SECONDS = 30.0
+_config_cache: Dict[Optional[str], Tuple[DatabricksConfigResponse, float]] = {}
+
+
+def invalidate_databricks_config_cache(group_id: Optional[str] = None) -> None:
+    """
+    Drop cached Databricks configurations after a configuration write.
+
+    Args:
+        group_id: Group whose configuration changed. None clears every group.
+    """
+    if group_id is None:
+        _config_cache.clear()
+    else:
+        _config_cache.pop(group_id, None)
+        # Unscoped lookups may have returned this group's configuration
+        _config_cache.pop(None, None)
+
 
 class DatabricksService:
     """
@@ -80,6 +101,7 @@ class DatabricksService:
             
             # Create the new configuration through repository
             new_config = await self.repository.create_config(config_data)
+            invalidate_databricks_config_cache(self.group_id)
             
             # Return the response
             return {
@@ -118,6 +140,10 @@ class DatabricksService:
         Returns:
             Current Databricks configuration or None if not found
         """
+        cached = _config_cache.get(self.group_id)
+        if cached and time.monotonic() - cached[1] < _CONFIG_CACHE_TTL_SECONDS:
+            return cached[0].model_copy()
+
         try:
             config = await self.repository.get_active_config(group_id=self.group_id)
 
@@ -126,7 +152,7 @@ class DatabricksService:
             
             logger.debug(f"Databricks config from DB: schema={config.schema}, catalog={config.catalog}")
             
-            return DatabricksConfigResponse(
+            response = DatabricksConfigResponse(
                 workspace_url=config.workspace_url,
                 warehouse_id=config.warehouse_id,
                 catalog=config.catalog,
@@ -148,6 +174,8 @@ class DatabricksService:
                 knowledge_chunk_size=config.knowledge_chunk_size if hasattr(config, 'knowledge_chunk_size') else 1000,
                 knowledge_chunk_overlap=config.knowledge_chunk_overlap if hasattr(config, 'knowledge_chunk_overlap') else 200
             )
+            _config_cache[self.group_id] = (response.model_copy(), time.monotonic())
+            return response
         except HTTPException:
             raise
         except Exception as e:
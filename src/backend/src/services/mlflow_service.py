@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.repositories.mlflow_repository import MLflowRepository
 from src.repositories.execution_history_repository import ExecutionHistoryRepository
 from src.services.model_config_service import ModelConfigService
+from src.services.databricks_service import invalidate_databricks_config_cache
 from src.core.logger import LoggerManager
 
 # Route MLflowService logs to system.log for user visibility
@@ -47,6 +48,8 @@ class MLflowService:
 
     async def set_enabled(self, enabled: bool) -> bool:
         ok = await self.repo.set_enabled(enabled=enabled, group_id=self.group_id)
+        if ok:
+            await self._commit_config_change()
         return ok
 
     # Evaluation toggle
@@ -55,8 +58,20 @@ class MLflowService:
 
     async def set_evaluation_enabled(self, enabled: bool) -> bool:
         ok = await self.repo.set_evaluation_enabled(enabled=enabled, group_id=self.group_id)
+        if ok:
+            await self._commit_config_change()
         return ok
 
+    async def _commit_config_change(self) -> None:
+        """
+        Commit a Databricks config toggle, then drop the cached configuration.
+
+        Invalidating only after the commit keeps readers on other sessions from
+        re-caching the old row while the update is still uncommitted.
+        """
+        await self.session.commit()
+        invalidate_databricks_config_cache(self.group_id)
+
     # Optional OBO token setter (router can inject per-request user token)
     def set_user_token(self, token: Optional[str]) -> None:
         try:
@@ -169,6 +169,7 @@ response = litellm.completion(
 - Tokens are cached with expiration tracking
 - Automatic refresh 5 minutes before expiration (configurable buffer)
 - Manual refresh available via `_refresh_service_token()`
+- Concurrent refreshes are coalesced: callers waiting on an in-flight refresh reuse its token
 
 ### Environment Variable Cleanup
 - Temporary cleanup during WorkspaceClient creation to avoid SDK conflicts
@@ -207,6 +208,7 @@ This pattern allows graceful fallback and clear error reporting.
 - Encryption: EncryptionUtils for secure token storage
 """
 
+import asyncio
 import os
 import logging
 import requests
@@ -352,6 +354,9 @@ class DatabricksAuth:
         self._service_token_fetched_at: Optional[float] = None
         self._service_token_expires_in: int = 3600  # Default 1 hour
         self._token_refresh_buffer: int = 300  # Refresh 5 minutes before expiration
+        # Serializes service token refreshes so concurrent callers share one OAuth round-trip
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refresh_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def _load_config(self) -> bool:
         """Load configuration from services if not already loaded."""
@@ -444,24 +449,41 @@ class DatabricksAuth:
         # Consider token expired if it's within the refresh buffer of actual expiration
         return elapsed >= (self._service_token_expires_in - self._token_refresh_buffer)
 
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        """Get the token refresh lock for the running event loop."""
+        # The global instance is shared by code running on different event loops
+        # (e.g. asyncio.run in worker threads), so keep one lock per loop
+        loop = asyncio.get_running_loop()
+        if self._refresh_lock is None or self._refresh_lock_loop is not loop:
+            self._refresh_lock = asyncio.Lock()
+            self._refresh_lock_loop = loop
+        return self._refresh_lock
+
     async def _refresh_service_token(self) -> Optional[str]:
         """Refresh the service principal OAuth token."""
-        logger.info("Refreshing service principal OAuth token")
-        try:
-            # Get a new token using the service principal credentials
-            new_token = await self._get_service_principal_token()
-            if new_token:
-                self._service_token = new_token
-                import time
-                self._service_token_fetched_at = time.time()
-                logger.info("Service principal token refreshed successfully")
-                return new_token
-            else:
-                logger.error("Failed to refresh service principal token")
+        fetched_at = self._service_token_fetched_at
+        async with self._get_refresh_lock():
+            # Another coroutine refreshed the token while we were waiting for the lock
+            if self._service_token and self._service_token_fetched_at != fetched_at:
+                logger.debug("Using service principal token refreshed by a concurrent request")
+                return self._service_token
+
+            logger.info("Refreshing service principal OAuth token")
+            try:
+                # Get a new token using the service principal credentials
+                new_token = await self._get_service_principal_token()
+                if new_token:
+                    self._service_token = new_token
+                    import time
+                    self._service_token_fetched_at = time.time()
+                    logger.info("Service principal token refreshed successfully")
+                    return new_token
+                else:
+                    logger.error("Failed to refresh service principal token")
+                    return None
+            except Exception as e:
+                logger.error(f"Error refreshing service principal token: {e}")
                 return None
-        except Exception as e:
-            logger.error(f"Error refreshing service principal token: {e}")
-            return None
 
     async def get_auth_headers(self, mcp_server_url: str = None, user_token: str = None) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
         """
@@ -91,6 +91,31 @@ def sample_flow_data():
         "flow_config": {"setting": "value"}
     }
 
+@pytest.fixture
+def make_databricks_config_row():
+    """Factory for mock DatabricksConfig rows carrying every field DatabricksConfigResponse reads."""
+    def _make(workspace_url="https://example.com"):
+        row = MagicMock()
+        row.workspace_url = workspace_url
+        row.warehouse_id = "wh"
+        row.catalog = "cat"
+        row.schema = "sch"
+        row.is_enabled = True
+        row.mlflow_enabled = False
+        row.mlflow_experiment_name = "exp"
+        row.evaluation_enabled = False
+        row.evaluation_judge_model = None
+        row.volume_enabled = False
+        row.volume_path = None
+        row.volume_file_format = "json"
+        row.volume_create_date_dirs = True
+        row.knowledge_volume_enabled = False
+        row.knowledge_volume_path = None
+        row.knowledge_chunk_size = 1000
+        row.knowledge_chunk_overlap = 200
+        return row
+    return _make
+
 # Async mock helpers
 @pytest.fixture
 def async_mock():
@@ -125,6 +150,9 @@ def cleanup_after_test():
     yield
     # Clean up any global state if needed
     # For example, clear in-memory caches, reset singletons, etc.
+    databricks_service = sys.modules.get("src.services.databricks_service")
+    if databricks_service is not None:
+        databricks_service.invalidate_databricks_config_cache()
 
 # Skip integration tests marker
 def pytest_configure(config):
@@ -4,8 +4,8 @@ Unit tests for EmbedderConfigBuilder
 Includes regression test for critical bug fix where crew_kwargs was replaced with empty dict.
 """
 import pytest
-from unittest.mock import patch, AsyncMock
-from src.engines.crewai.config.embedder_config_builder import EmbedderConfigBuilder
+from unittest.mock import patch, AsyncMock, MagicMock
+from src.engines.crewai.config.embedder_config_builder import EmbedderConfigBuilder, _get_embedding_session
 
 
 class TestEmbedderConfigBuilder:
@@ -206,3 +206,58 @@ class TestEmbedderConfigBuilder:
             # Embedder should be configured
             assert 'embedder' in result_kwargs
             assert result_kwargs['embedder']['provider'] == 'openai'
+
+
+class TestEmbeddingSession:
+    """Test the shared HTTP session used by the Databricks embedder"""
+
+    def test_embedding_session_is_reused(self):
+        """The same pooled session is returned on every call"""
+        session = _get_embedding_session()
+
+        assert _get_embedding_session() is session
+        adapter = session.get_adapter("https://example.cloud.databricks.com")
+        # Only connection failures are retried; read errors and statuses are not
+        assert adapter.max_retries.connect == 3
+        assert adapter.max_retries.read is False
+        assert adapter.max_retries.status is False
+
+    def test_embedding_session_enables_tcp_keepalive(self):
+        """Pooled connections are opened with SO_KEEPALIVE"""
+        import socket
+
+        adapter = _get_embedding_session().get_adapter("https://example.cloud.databricks.com")
+
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    @pytest.mark.asyncio
+    async def test_databricks_embedding_error_status_surfaces_response(self):
+        """A non-200 response raises the embedder's own error with the server body"""
+        config = {
+            'agents': [
+                {
+                    'role': 'test_agent',
+                    'embedder_config': {
+                        'provider': 'databricks',
+                        'config': {'model': 'databricks-gte-large-en'}
+                    }
+                }
+            ]
+        }
+        builder = EmbedderConfigBuilder(config, user_token="test_token")
+
+        with patch('src.utils.databricks_auth.get_databricks_auth_headers', new_callable=AsyncMock) as mock_auth:
+            with patch.object(builder, '_get_databricks_endpoint', new_callable=AsyncMock, return_value='https://example.databricks.com'):
+                mock_auth.return_value = ({'Authorization': 'Bearer token'}, None)
+                _, custom_embedder, _ = await builder.configure_embedder({})
+
+        mock_response = MagicMock(status_code=503, text="Service overloaded")
+        mock_session = MagicMock()
+        mock_session.post.return_value = mock_response
+
+        with patch('src.engines.crewai.config.embedder_config_builder._get_embedding_session', return_value=mock_session):
+            with pytest.raises(Exception, match="Embedding API error 503: Service overloaded"):
+                custom_embedder(["hello"])
+
+        mock_session.post.assert_called_once()
@@ -174,6 +174,30 @@ class TestDatabricksConfigRepositoryDeactivateAll:
             await databricks_config_repository.deactivate_all()
         
         mock_async_session.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_deactivate_all_without_commit(self, databricks_config_repository, mock_async_session):
+        """Test deactivate all leaves the transaction open when commit=False."""
+        mock_async_session.execute.return_value = MagicMock()
+        
+        await databricks_config_repository.deactivate_all(group_id="group-1", commit=False)
+        
+        mock_async_session.execute.assert_called_once()
+        mock_async_session.commit.assert_not_called()
+
+
+class TestDatabricksConfigRepositoryLockActiveConfigs:
+    """Test cases for lock_active_configs method."""
+    
+    @pytest.mark.asyncio
+    async def test_lock_active_configs_uses_for_update(self, databricks_config_repository, mock_async_session):
+        """Test that active rows are selected with a row lock."""
+        await databricks_config_repository.lock_active_configs(group_id="group-1")
+        
+        mock_async_session.execute.assert_called_once()
+        query = mock_async_session.execute.call_args[0][0]
+        assert query._for_update_arg is not None
+        mock_async_session.commit.assert_not_called()
 
 
 class TestDatabricksConfigRepositoryCreateConfig:
@@ -197,6 +221,22 @@ class TestDatabricksConfigRepositoryCreateConfig:
                 mock_async_session.flush.assert_called_once()
                 mock_async_session.commit.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_create_config_single_transaction(self, databricks_config_repository, mock_async_session):
+        """Test create config locks active rows and deactivates without an intermediate commit."""
+        config_data = {"workspace_url": "https://new.databricks.com", "group_id": "group-1"}
+        
+        with patch('src.repositories.databricks_config_repository.DatabricksConfig') as mock_config_class:
+            mock_config_class.return_value = MockDatabricksConfig(**config_data)
+            
+            with patch.object(databricks_config_repository, 'lock_active_configs') as mock_lock, \
+                 patch.object(databricks_config_repository, 'deactivate_all') as mock_deactivate:
+                await databricks_config_repository.create_config(config_data)
+                
+                mock_lock.assert_called_once_with(group_id="group-1")
+                mock_deactivate.assert_called_once_with(group_id="group-1", commit=False)
+                mock_async_session.commit.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_create_config_with_complex_data(self, databricks_config_repository, mock_async_session):
         """Test configuration creation with complex data."""
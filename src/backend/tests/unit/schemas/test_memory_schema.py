@@ -81,6 +81,15 @@ class TestMemoryActionResponse:
         missing_fields = [error["loc"][0] for error in errors if error["type"] == "missing"]
         assert "message" in missing_fields
 
+    def test_memory_action_response_invalid_status(self):
+        """Test MemoryActionResponse rejects statuses other than success/failure."""
+        with pytest.raises(ValidationError) as exc_info:
+            MemoryActionResponse(status="done", message="Memory reset")
+        
+        errors = exc_info.value.errors()
+        assert errors[0]["loc"] == ("status",)
+        assert errors[0]["type"] == "literal_error"
+
 
 class TestMemorySearchItem:
     """Test cases for MemorySearchItem schema."""
@@ -448,6 +457,11 @@ class TestMemoryCleanupResponse:
         missing_fields = [error["loc"][0] for error in errors if error["type"] == "missing"]
         assert "count" in missing_fields
 
+    def test_memory_cleanup_response_invalid_status(self):
+        """Test MemoryCleanupResponse rejects statuses other than success/failure."""
+        with pytest.raises(ValidationError):
+            MemoryCleanupResponse(status="partial", message="Cleanup completed", count=1)
+
 
 class TestSchemaIntegration:
     """Integration tests for memory schema interactions."""
@@ -185,9 +185,9 @@ class TestTaskBase:
         assert task.description == "A test task"
         assert task.expected_output == "Test results"
         assert task.agent_id is None
-        assert task.tools == []
+        assert task.tools == ()
         assert task.async_execution is False
-        assert task.context == []
+        assert task.context == ()
         assert isinstance(task.config, TaskConfig)
         assert task.output_json is None
         assert task.output_pydantic is None
@@ -226,9 +226,9 @@ class TestTaskBase:
         assert task.description == "A complex task with all options"
         assert task.agent_id == "agent-123"
         assert task.expected_output == "Comprehensive analysis report"
-        assert task.tools == ["pandas", "numpy", "matplotlib"]
+        assert task.tools == ("pandas", "numpy", "matplotlib")
         assert task.async_execution is True
-        assert task.context == ["task-001", "task-002"]
+        assert task.context == ("task-001", "task-002")
         assert isinstance(task.config, TaskConfig)
         assert task.config.priority == 1
         assert task.config.human_input is True
@@ -312,7 +312,7 @@ class TestTaskCreate:
         assert task.description == "Task creation test"
         assert task.expected_output == "Creation results"
         assert task.agent_id is None
-        assert task.tools == []
+        assert task.tools == ()
         assert isinstance(task.config, TaskConfig)
     
     def test_task_create_with_custom_config(self):
@@ -336,7 +336,7 @@ class TestTaskCreate:
         assert task.config.timeout == 300
         assert task.config.human_input is True
         assert task.agent_id == "agent-456"
-        assert task.tools == ["custom_tool"]
+        assert task.tools == ("custom_tool",)
         assert task.async_execution is True
 
 
@@ -447,7 +447,7 @@ class TestTaskInDBBase:
         
         # Should inherit all base class defaults
         assert task.agent_id is None
-        assert task.tools == []
+        assert task.tools == ()
         assert task.async_execution is False
         assert isinstance(task.config, TaskConfig)
     
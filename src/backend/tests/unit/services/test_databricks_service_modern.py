@@ -2,7 +2,7 @@ import pytest
 import os
 from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 
-from src.services.databricks_service import DatabricksService
+from src.services.databricks_service import DatabricksService, invalidate_databricks_config_cache
 
 
 @pytest.mark.asyncio
@@ -42,3 +42,40 @@ async def test_setup_token_uses_provider_api_key_when_no_personal_token():
         assert auth.token == "test-provider-key"
         assert auth.workspace_url == "https://example.com"
 
+
+@pytest.mark.asyncio
+async def test_get_databricks_config_cached_per_group(make_databricks_config_row):
+    service = DatabricksService(MagicMock(), group_id="group-a")
+    service.repository = AsyncMock()
+    service.repository.get_active_config.return_value = make_databricks_config_row()
+
+    first = await service.get_databricks_config()
+    second = await service.get_databricks_config()
+
+    assert first.workspace_url == second.workspace_url == "https://example.com"
+    service.repository.get_active_config.assert_awaited_once_with(group_id="group-a")
+
+    # A different group is not served from another group's cache entry
+    other = DatabricksService(MagicMock(), group_id="group-b")
+    other.repository = AsyncMock()
+    other.repository.get_active_config.return_value = None
+    assert await other.get_databricks_config() is None
+
+
+@pytest.mark.asyncio
+async def test_get_databricks_config_cache_invalidated_and_expires(make_databricks_config_row):
+    service = DatabricksService(MagicMock(), group_id="group-a")
+    service.repository = AsyncMock()
+    service.repository.get_active_config.side_effect = [
+        make_databricks_config_row("https://one.example.com"),
+        make_databricks_config_row("https://two.example.com"),
+        make_databricks_config_row("https://three.example.com"),
+    ]
+
+    assert (await service.get_databricks_config()).workspace_url == "https://one.example.com"
+
+    invalidate_databricks_config_cache("group-a")
+    assert (await service.get_databricks_config()).workspace_url == "https://two.example.com"
+
+    with patch('src.services.databricks_service._CONFIG_CACHE_TTL_SECONDS', 0):
+        assert (await service.get_databricks_config()).workspace_url == "https://three.example.com"
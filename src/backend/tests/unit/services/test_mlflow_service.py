@@ -79,6 +79,75 @@ class TestMLflowServiceEnableDisable:
         service.repo.set_enabled.assert_called_once_with(enabled=False, group_id="test-group")
 
 
+class TestMLflowServiceConfigCache:
+    """Test that MLflow toggles refresh the cached Databricks configuration."""
+
+    @pytest.mark.asyncio
+    async def test_set_enabled_commits_before_invalidating_cache(self):
+        """Test the cache is only dropped once the toggle is committed."""
+        session = AsyncMock(spec=AsyncSession)
+        service = MLflowService(session=session, group_id="test-group")
+        service.repo.set_enabled = AsyncMock(return_value=True)
+
+        def check_committed(group_id):
+            session.commit.assert_awaited_once()
+
+        with patch('src.services.mlflow_service.invalidate_databricks_config_cache',
+                   side_effect=check_committed) as mock_invalidate:
+            assert await service.set_enabled(True) is True
+
+        mock_invalidate.assert_called_once_with("test-group")
+
+    @pytest.mark.asyncio
+    async def test_set_enabled_not_found_skips_commit(self):
+        """Test nothing is committed or invalidated when there is no config."""
+        session = AsyncMock(spec=AsyncSession)
+        service = MLflowService(session=session, group_id="test-group")
+        service.repo.set_enabled = AsyncMock(return_value=False)
+
+        with patch('src.services.mlflow_service.invalidate_databricks_config_cache') as mock_invalidate:
+            assert await service.set_enabled(True) is False
+
+        session.commit.assert_not_awaited()
+        mock_invalidate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_toggles_visible_to_next_config_read(self, make_databricks_config_row):
+        """Test a cached config read after a toggle returns the committed values."""
+        from src.services.databricks_service import DatabricksService
+
+        row = make_databricks_config_row()
+
+        dbx_service = DatabricksService(MagicMock(), group_id="test-group")
+        dbx_service.repository = AsyncMock()
+        dbx_service.repository.get_active_config.return_value = row
+        assert (await dbx_service.get_databricks_config()).mlflow_enabled is False
+
+        session = AsyncMock(spec=AsyncSession)
+        service = MLflowService(session=session, group_id="test-group")
+        pending = {}
+        service.repo.set_enabled = AsyncMock(
+            side_effect=lambda enabled, group_id: pending.update(mlflow_enabled=enabled) or True
+        )
+        service.repo.set_evaluation_enabled = AsyncMock(
+            side_effect=lambda enabled, group_id: pending.update(evaluation_enabled=enabled) or True
+        )
+
+        def commit():
+            for name, value in pending.items():
+                setattr(row, name, value)
+            pending.clear()
+
+        session.commit.side_effect = commit
+
+        await service.set_enabled(True)
+        assert (await dbx_service.get_databricks_config()).mlflow_enabled is True
+
+        await service.set_evaluation_enabled(True)
+        assert (await dbx_service.get_databricks_config()).evaluation_enabled is True
+        assert dbx_service.repository.get_active_config.await_count == 3
+
+
 class TestMLflowServiceEvaluation:
     """Test MLflow evaluation functionality."""
 
@@ -493,8 +493,8 @@ class TestTaskServiceCreateWithGroup:
         
         assert result == created_task
         call_args = mock_repository.create.call_args[0][0]
-        assert call_args["tools"] == ["tool1", "tool2"]
-        assert call_args["context"] == ["task-1", "task-2"]
+        assert call_args["tools"] == ("tool1", "tool2")
+        assert call_args["context"] == ("task-1", "task-2")
         assert call_args["async_execution"] is True
 
 
@@ -6,8 +6,11 @@ from typing import Dict, Any, Optional, Tuple
 
 # Test databricks_auth utility functions - based on actual code inspection
 
+import asyncio
+
 from src.utils.databricks_auth import (
     AuthContext,
+    DatabricksAuth,
     extract_user_token_from_request,
     is_scope_error,
     setup_environment_variables,
@@ -526,3 +529,47 @@ class TestAsyncFunctions:
 
         assert isinstance(result, tuple)
         assert len(result) == 2
+
+
+class TestServiceTokenRefresh:
+    """Test service principal token refresh coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_token_request(self):
+        """Concurrent refreshes issue a single OAuth request"""
+        auth = DatabricksAuth()
+        calls = []
+
+        async def fake_get_token():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "spn-token"
+
+        with patch.object(auth, '_get_service_principal_token', side_effect=fake_get_token):
+            results = await asyncio.gather(*[auth._refresh_service_token() for _ in range(5)])
+
+        assert results == ["spn-token"] * 5
+        assert len(calls) == 1
+        assert auth._service_token == "spn-token"
+
+    @pytest.mark.asyncio
+    async def test_sequential_refresh_still_forces_new_token(self):
+        """A manual refresh after a completed one fetches a new token"""
+        auth = DatabricksAuth()
+
+        with patch.object(auth, '_get_service_principal_token', new_callable=AsyncMock) as mock_get_token:
+            mock_get_token.side_effect = ["token-1", "token-2"]
+            assert await auth._refresh_service_token() == "token-1"
+            assert await auth._refresh_service_token() == "token-2"
+
+        assert mock_get_token.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_returns_none(self):
+        """A failed refresh returns None and leaves no cached token"""
+        auth = DatabricksAuth()
+
+        with patch.object(auth, '_get_service_principal_token', new_callable=AsyncMock, return_value=None):
+            assert await auth._refresh_service_token() is None
+
+        assert auth._service_token is None